@@ -1,6 +1,32 @@
+import os
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.utils.autoreload import DJANGO_AUTORELOAD_ENV
+
+
+def is_runserver() -> bool:
+    """True in the process serving `runserver` requests, not in its autoreloader parent"""
+    if len(sys.argv) < 2 or sys.argv[1] != "runserver":
+        return False
+    return os.environ.get(DJANGO_AUTORELOAD_ENV) == "true" or "--noreload" in sys.argv
 
 
 class DrfPydanticOpenapi(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "drf_pydantic_openapi"
+
+    def ready(self):
+        from .settings import SETTINGS_NAME
+
+        # Read the raw setting, resolving the config here would load it in every process
+        if not getattr(settings, SETTINGS_NAME, {}).get("WARM_UP", False):
+            return
+
+        # Only the development server is detected here. Other servers call `start_warm_up` from
+        # their wsgi.py/asgi.py, so workers and management commands never build the schema.
+        if is_runserver():
+            from .warm_up import start_warm_up
+
+            start_warm_up(sender=self.__class__)
@@ -0,0 +1,85 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.urls import URLResolver, get_resolver
+from django.urls.resolvers import ResolverMatch
+from loguru import logger
+from rest_framework.schemas.generators import BaseSchemaGenerator
+from rest_framework.views import APIView
+
+from .path import Path
+
+
+@dataclass
+class EndpointTable:
+    """
+    Endpoints of an url conf along with the views created for them.
+    Views are created without a request, they are shared between schema builds and must not be mutated.
+    """
+
+    resolver: URLResolver
+    view_endpoints: list[tuple[str, str, APIView]]
+    resolver_matches: dict[str, ResolverMatch] = field(default_factory=dict, repr=False)
+    paths: dict[tuple[str, str, str, int], Path] = field(default_factory=dict, repr=False)
+    checked_operation_ids: set[tuple[str, str | None]] = field(default_factory=set, repr=False)
+
+    def resolve(self, path: str) -> ResolverMatch:
+        if (resolver_match := self.resolver_matches.get(path)) is None:
+            resolver_match = self.resolver_matches[path] = self.resolver.resolve(path)
+        return resolver_match
+
+    def get_path(self, path: str, path_prefix: str, method: str, view: APIView) -> Path:
+        """Reuse the `Path`, so its tags and operation id are only computed once"""
+        # Different views can coerce to the same path, the views live as long as the table
+        key = (path, path_prefix, method, id(view))
+        if (cached_path := self.paths.get(key)) is None:
+            cached_path = self.paths[key] = Path(path=path, path_prefix=path_prefix, method=method, view=view)
+        return cached_path
+
+    def check_operation_ids(self, path_prefix: str, api_version: str | None, paths: dict[str, list[Path]]):
+        """Warn about duplicate operation ids, once per path prefix and version of the table"""
+        key = (path_prefix, api_version)
+        if key in self.checked_operation_ids:
+            return
+        self.checked_operation_ids.add(key)
+
+        # Views sharing a path and method end up as a single operation, they are not duplicates
+        operations = defaultdict(set)
+        for path, path_list in paths.items():
+            for api_path in path_list:
+                operations[api_path.get_operation_id()].add(f"{api_path.method} {path}")
+        for operation_id, operation_paths in operations.items():
+            if len(operation_paths) > 1:
+                logger.warning(f"Duplicate operationId {operation_id}: {', '.join(sorted(operation_paths))}")
+
+
+class EndpointCache:
+    """
+    Endpoint tables keyed by url conf, reused across schema builds.
+    A table is rebuilt once django replaces the url resolver (`clear_url_caches`, `ROOT_URLCONF` change).
+    """
+
+    def __init__(self):
+        self._tables: dict = {}
+
+    def get(self, generator: BaseSchemaGenerator) -> EndpointTable:
+        resolver = get_resolver(generator.urlconf)
+        if generator.patterns is not None:
+            # Explicit patterns aren't tied to the url conf, don't cache them
+            return self._build(generator, resolver)
+
+        table = self._tables.get(generator.urlconf)
+        if table is None or table.resolver is not resolver:
+            table = self._tables[generator.urlconf] = self._build(generator, resolver)
+        return table
+
+    def _build(self, generator: BaseSchemaGenerator, resolver: URLResolver) -> EndpointTable:
+        generator._initialise_endpoints()
+        _, view_endpoints = generator._get_paths_and_endpoints(None)
+        return EndpointTable(resolver=resolver, view_endpoints=view_endpoints)
+
+    def clear(self):
+        self._tables.clear()
+
+
+endpoint_cache = EndpointCache()
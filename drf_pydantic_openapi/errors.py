@@ -3,6 +3,8 @@ from typing import ClassVar
 
 from pydantic import BaseModel
 
+from .schema_cache import model_schema_cache
+
 
 class HttpError(Exception):
     mime_type = "application/json"
@@ -28,7 +30,7 @@ class HttpError(Exception):
     def schema(cls):
         # schema =  PydanticSchema(schema_class=cls.ResponseModel)
         model_name = f"{cls.status_code}_ResponseModel"
-        return cls.ResponseModel.model_json_schema(ref_template=f"#/components/schemas/{model_name}")
+        return model_schema_cache.get(cls.ResponseModel, ref_template=f"#/components/schemas/{model_name}")
 
 
 class SimpleHttpError(HttpError):
@@ -1,38 +1,89 @@
 import inspect
+import json
 import os
 import re
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from inspect import isclass
 from types import UnionType
 from typing import get_args, get_origin
 
-from django.urls import get_resolver
 from loguru import logger
 
 # TODO: check desired openapi version and import accordingly
 from openapi_pydantic import (
+    Components,
     Info,
     MediaType,
     OpenAPI,
     Operation,
+    PathItem,
     RequestBody,
     Response,
     Schema,
     Server,
 )
-from openapi_pydantic.util import PydanticSchema, construct_open_api_with_schema_class
+from openapi_pydantic.util import PydanticSchema, _handle_pydantic_schema, get_mode
 from pydantic import BaseModel
+from pydantic.json_schema import models_json_schema
+from rest_framework.request import clone_request
 from rest_framework.schemas.generators import BaseSchemaGenerator
 
+from .endpoints import endpoint_cache
 from .path import Path
+from .schema_cache import REF_TEMPLATE, model_schema_cache
 from .settings import config
-from .utils import (
-    Docstring,
-    ParameterLocation,
-    PathItemEx,
-    get_view_version,
-    method_mapping,
-)
+from .utils import Docstring, ParameterLocation, get_view_version, method_mapping
+
+
+class PathItemEx(PathItem):
+    def is_empty(self):
+        return not (self.get or self.post or self.delete or self.head or self.put or self.patch)
+
+
+def get_component_schemas(schema_classes: Iterable[type[BaseModel]]) -> dict[str, dict]:
+    """
+    Component schemas of the given models and every model they reference.
+    Each model is taken from the `model_schema_cache` in its own `json_schema_mode`. When the same name
+    comes back with different definitions (e.g. a nested model used in both modes), the models are
+    generated together instead so pydantic can split them into `Name-Input`/`Name-Output`.
+    """
+    schema_classes = sorted(schema_classes, key=lambda x: x.__name__)
+    definitions = {}
+    for schema_class in schema_classes:
+        schema = dict(model_schema_cache.get(schema_class, mode=get_mode(schema_class)))
+        class_definitions = dict(schema.pop("$defs", {}))
+        # Self referencing models are already in their own `$defs`
+        class_definitions.setdefault(schema_class.__name__, schema)
+        for name, definition in class_definitions.items():
+            if definitions.setdefault(name, definition) != definition:
+                logger.debug(f"Schema {name} has conflicting definitions, generating the models together")
+                _, schema_definitions = models_json_schema(
+                    [(c, get_mode(c)) for c in schema_classes],
+                    by_alias=True,
+                    ref_template=REF_TEMPLATE,
+                )
+                return schema_definitions.get("$defs", {})
+    return definitions
+
+
+def construct_open_api_with_schema_cache(open_api: OpenAPI) -> OpenAPI:
+    """
+    Same as `openapi_pydantic.util.construct_open_api_with_schema_class`, but model schemas are
+    taken from the process wide `model_schema_cache` instead of being regenerated on every build
+    """
+    new_open_api = open_api.model_copy(deep=True)
+    # Replaces every `PydanticSchema` with a reference and returns the referenced models
+    schema_classes = _handle_pydantic_schema(new_open_api)
+
+    if not new_open_api.components:
+        new_open_api.components = Components()
+    schemas = {name: Schema.model_validate(value) for name, value in get_component_schemas(schema_classes).items()}
+    if new_open_api.components.schemas:
+        new_open_api.components.schemas.update(schemas)
+    else:
+        new_open_api.components.schemas = schemas
+    return new_open_api
 
 
 class Document(BaseSchemaGenerator):
@@ -165,35 +216,80 @@ class Document(BaseSchemaGenerator):
                     setattr(docs, path.method.lower(), operation)
         return docs
 
-    def get_schema(self, request=None, public=False):
-        self._initialise_endpoints()
-        _, view_endpoints = self._get_paths_and_endpoints(request)
+    def get_paths(self, request=None) -> dict[str, list[Path]]:
+        endpoint_table = endpoint_cache.get(self)
+        view_endpoints = endpoint_table.view_endpoints
         paths = defaultdict(list)
         path_prefix = self.find_path_prefix(view_endpoints)
 
         for path, method, view in view_endpoints:
             if self.api_version:
+                # Cached views are shared, give the version check its own request
+                view_request = clone_request(request, method)
                 # resolver required by NamespaceVersioning
-                view.request.resolver_match = get_resolver().resolve(path)
-                if get_view_version(view) != self.api_version:
+                view_request.resolver_match = endpoint_table.resolve(path)
+                if get_view_version(view, view_request) != self.api_version:
                     continue
-            paths[path].append(
-                Path(
-                    path=path,
-                    path_prefix=path_prefix,
-                    method=method,
-                    view=view,
-                ),
-            )
-
-        for path in paths.keys():
-            if docs := self.generate_docs(paths[path]):
-                if not docs.is_empty():
-                    self.openapi.paths[path] = docs
-
-        self.openapi = construct_open_api_with_schema_class(self.openapi)
+            paths[path].append(endpoint_table.get_path(path, path_prefix, method, view))
+
+        endpoint_table.check_operation_ids(path_prefix, self.api_version, paths)
+        return paths
+
+    def iter_path_items(self, request=None) -> Iterator[tuple[str, PathItemEx]]:
+        """Generate the path items one by one, empty ones are skipped"""
+        for path, path_list in self.get_paths(request).items():
+            docs = self.generate_docs(path_list)
+            if not docs.is_empty():
+                yield path, docs
+
+    def get_schema(self, request=None, public=False):
+        for path, docs in self.iter_path_items(request):
+            self.openapi.paths[path] = docs
+
+        self.openapi = construct_open_api_with_schema_cache(self.openapi)
 
         if config.security_definitions:
             self.openapi.components.securitySchemes = config.security_definitions
             self.openapi.security = [{security_method: []} for security_method in config.security_definitions.keys()]
         return self.openapi.model_dump_json(by_alias=True, exclude_none=True)
+
+    def iter_schema(self, request=None) -> Iterator[str]:
+        """
+        Streaming version of `get_schema`.
+        Yields the json document in chunks, each path item and component schema is serialized
+        as soon as it is generated so the whole document is never held in memory at once.
+        Errors raised while iterating leave the document truncated.
+        """
+        if config.security_definitions:
+            self.openapi.security = [{security_method: []} for security_method in config.security_definitions.keys()]
+        head = self.openapi.model_dump_json(by_alias=True, exclude_none=True, exclude={"paths", "components"})
+        yield head[:-1] + ',"paths":{'
+
+        schema_classes = set()
+        separator = ""
+        for path, docs in self.iter_path_items(request):
+            # Replaces every `PydanticSchema` with a reference and returns the referenced models
+            schema_classes.update(_handle_pydantic_schema(docs))
+            yield f"{separator}{json.dumps(path)}:{docs.model_dump_json(by_alias=True, exclude_none=True)}"
+            separator = ","
+
+        yield '},"components":{"schemas":{'
+        separator = ""
+        for name, definition in get_component_schemas(schema_classes).items():
+            schema = Schema.model_validate(definition)
+            yield f"{separator}{json.dumps(name)}:{schema.model_dump_json(by_alias=True, exclude_none=True)}"
+            separator = ","
+        yield "}"
+
+        if config.security_definitions:
+            components = Components(securitySchemes=config.security_definitions)
+            security_schemes = components.model_dump_json(by_alias=True, exclude_none=True, include={"securitySchemes"})
+            yield "," + security_schemes[1:-1]
+        yield "}}"
+
+
+def build_schema(api_version: str | None, tag_path_regex: str | None, request=None) -> str:
+    """Reload the ref sources and generate the schema json"""
+    config.initialize_sources()
+    document = Document(api_version=api_version, tag_path_regex=tag_path_regex)
+    return document.get_schema(request=request)
@@ -1,10 +1,18 @@
 import re
 from dataclasses import dataclass
+from functools import cache, cached_property
 
 from rest_framework.schemas.utils import is_list_view
 
 from .utils import method_mapping
 
+_path_variable_pattern = re.compile(r"\{[\w\-]+\}")
+
+
+@cache
+def _compile_path_prefix(path_prefix: str) -> re.Pattern:
+    return re.compile(path_prefix, flags=re.IGNORECASE)
+
 
 @dataclass
 class Path:
@@ -23,18 +31,26 @@ class Path:
             self.path_prefix = "^" + self.path_prefix
 
     def get_tags(self) -> list[str]:
-        return self._tokenize_path()[:1]
+        return self._tokens[:1]
 
     def _tokenize_path(self) -> list:
+        return list(self._tokens)
+
+    @cached_property
+    def _tokens(self) -> list:
         # remove path prefix
-        path = re.sub(pattern=self.path_prefix, repl="", string=self.path, flags=re.IGNORECASE)
+        path = _compile_path_prefix(self.path_prefix).sub("", self.path)
         # remove path variables
-        path = re.sub(pattern=r"\{[\w\-]+\}", repl="", string=path)
+        path = _path_variable_pattern.sub("", path)
         # cleanup and tokenize remaining parts.
         path = path.rstrip("/").lstrip("/").split("/")
         return [t for t in path if t]
 
     def get_operation_id(self) -> str:
+        return self._operation_id
+
+    @cached_property
+    def _operation_id(self) -> str:
         tokenized_path = self._tokenize_path()
         # replace dashes as they can be problematic later in code generation
         tokenized_path = [t.replace("-", "_") for t in tokenized_path]
@@ -1,12 +1,13 @@
+import hashlib
 from collections import defaultdict
 from pathlib import Path
 from urllib.parse import urlparse
 
-import jsonref
-import requests
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
+from .schema_cache import model_schema_cache
+
 
 @dataclass
 class RefSource:
@@ -15,12 +16,15 @@ class RefSource:
     schemas_: dict = Field(default={}, repr=False)
     components_: dict = Field(default={}, repr=False)
     initialized: bool = Field(default=False, repr=False)
+    checksum_: str = Field(default="", repr=False)
 
     def _load_resource(self) -> str:
         parsed = urlparse(self.url)
         if parsed.scheme == "file":
             return Path(parsed.path).read_text()
         elif parsed.scheme in ["http", "https"]:
+            import requests
+
             r = requests.get(self.url, timeout=5)
             return r.text
         else:
@@ -29,10 +33,19 @@ class RefSource:
     def init(self, force: bool = False) -> None:
         if not force and self.initialized:
             return
-        data = jsonref.loads(self._load_resource())
+        import jsonref
+
+        resource = self._load_resource()
+        checksum = hashlib.sha256(resource.encode()).hexdigest()
+        if self.initialized and checksum == self.checksum_:
+            return
+        data = jsonref.loads(resource)
         # self.replace_refs_with_empty_dict(data)
         self.schemas_ = data["components"]["schemas"]
         self.components_ = defaultdict(str)
         for k, v in self.schemas_.items():
             self.components_.setdefault(k, v)
+        self.checksum_ = checksum
         self.initialized = True
+        # Cached model schemas may have been extended from the previous content
+        model_schema_cache.clear()
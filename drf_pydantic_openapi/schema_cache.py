@@ -0,0 +1,74 @@
+import threading
+from collections.abc import Callable, Hashable
+
+from pydantic import BaseModel
+
+REF_TEMPLATE = "#/components/schemas/{model}"
+
+
+class ModelSchemaCache:
+    """
+    Process wide cache of pydantic json schemas.
+    Entries are keyed by the model's import path, ref template and mode; the model class is stored
+    alongside the schema so a redefined class (module reload, autoreload) misses the cache.
+    Cached schemas are shared, callers must not mutate them.
+    """
+
+    def __init__(self):
+        self._schemas: dict[tuple[str, str, str], tuple[type[BaseModel], dict]] = {}
+
+    def get(self, model: type[BaseModel], ref_template: str = REF_TEMPLATE, mode: str = "validation") -> dict:
+        key = (f"{model.__module__}.{model.__qualname__}", ref_template, mode)
+        if (entry := self._schemas.get(key)) and entry[0] is model:
+            return entry[1]
+
+        schema = model.model_json_schema(ref_template=ref_template, mode=mode)
+        self._schemas[key] = (model, schema)
+        return schema
+
+    def clear(self):
+        self._schemas.clear()
+
+
+model_schema_cache = ModelSchemaCache()
+
+
+class DocumentCache:
+    """
+    Rendered schema documents, keyed by `(api_version, tag_path_regex)`.
+    A document is built at most once per key, concurrent callers wait for the running build.
+    """
+
+    def __init__(self):
+        self._documents: dict[Hashable, str] = {}
+        self._building: dict[Hashable, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], str]) -> str:
+        while True:
+            with self._lock:
+                if (document := self._documents.get(key)) is not None:
+                    return document
+                event = self._building.get(key)
+                if event is None:
+                    event = self._building[key] = threading.Event()
+                    break
+            # Another thread is building it, if that build fails one of the waiters retries
+            event.wait()
+
+        try:
+            document = build()
+            with self._lock:
+                self._documents[key] = document
+            return document
+        finally:
+            with self._lock:
+                self._building.pop(key, None)
+            event.set()
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+
+document_cache = DocumentCache()
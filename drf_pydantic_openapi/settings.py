@@ -1,8 +1,14 @@
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import LazyObject, empty
 from loguru import logger
 from pydantic import BaseModel, Field
 
 from .ref_source import RefSource
+from .schema_cache import document_cache, model_schema_cache
+
+SETTINGS_NAME = "DRF_PYDANTIC_OPENAPI"
 
 
 class Config(BaseModel):
@@ -15,6 +21,18 @@ class Config(BaseModel):
     title: str = Field(default="DPO Api", alias="TITLE")
     description: str = Field(default="", alias="DESCRIPTION")
     security_definitions: dict = Field(default={}, alias="SECURITY_DEFINITIONS")
+    # Build and cache the schema of every version in the background on startup
+    warm_up: bool = Field(default=False, alias="WARM_UP")
+    # Fraction of responses validated by `ResponseValidationMixin`, between 0 and 1
+    response_validation_sample_rate: float = Field(default=0.0, alias="RESPONSE_VALIDATION_SAMPLE_RATE")
+    # Seconds a single response validation may take
+    response_validation_time_budget: float = Field(default=0.005, alias="RESPONSE_VALIDATION_TIME_BUDGET")
+    # Responses with more json values are never validated
+    response_validation_max_items: int = Field(default=10_000, alias="RESPONSE_VALIDATION_MAX_ITEMS")
+    # Consecutive validations over the budget before the handler is paused
+    response_validation_max_overruns: int = Field(default=3, alias="RESPONSE_VALIDATION_MAX_OVERRUNS")
+    # Seconds a paused handler isn't validated
+    response_validation_cooldown: float = Field(default=300.0, alias="RESPONSE_VALIDATION_COOLDOWN")
 
     def get_source(self, name: str) -> RefSource | None:
         """Find source by given source name"""
@@ -30,9 +48,36 @@ class Config(BaseModel):
             ref_source.init(force=True)
 
 
-USER_SETTINGS = getattr(settings, "DRF_PYDANTIC_OPENAPI", {"REF_SOURCES": {}})
+def load_config() -> Config:
+    """Build the config from the user's django settings"""
+    # Copy so the django setting itself is never mutated
+    user_settings = dict(getattr(settings, SETTINGS_NAME, {}))
+    # Override ref_sources to use the class
+    user_settings["REF_SOURCES"] = {
+        name: RefSource(name, value) for name, value in user_settings.get("REF_SOURCES", {}).items()
+    }
+    return Config(**user_settings)
+
+
+class LazyConfig(LazyObject):
+    """
+    Resolve the config on first attribute access instead of at import time
+    """
+
+    def _setup(self):
+        self._wrapped = load_config()
+
+    def reload(self):
+        """Drop the resolved config, it will be rebuilt on next access"""
+        self._wrapped = empty
+
+
+config = LazyConfig()
 
-# Override ref_sources to use the class
-USER_SETTINGS["REF_SOURCES"] = {name: RefSource(name, value) for name, value in USER_SETTINGS["REF_SOURCES"].items()}
 
-config = Config(**USER_SETTINGS)
+@receiver(setting_changed)
+def reload_config(*, setting, **kwargs):
+    if setting == SETTINGS_NAME:
+        config.reload()
+        model_schema_cache.clear()
+        document_cache.clear()
@@ -0,0 +1,14 @@
+from django.dispatch import Signal
+
+# Sent when a sampled response doesn't match its documented model.
+# Arguments: request, response, status_code, errors
+response_contract_mismatch = Signal()
+
+# Sent when validation of a handler is paused after going over the time budget
+# `RESPONSE_VALIDATION_MAX_OVERRUNS` times in a row.
+# Arguments: request, response, handler, duration
+response_validation_over_budget = Signal()
+
+# Sent by the background warm-up once every version is built.
+# Arguments: versions, duration
+schema_warm_up_finished = Signal()
@@ -2,20 +2,20 @@ import builtins
 import re
 from datetime import date, datetime, time
 from enum import Enum
+from functools import cache
 from inspect import isclass
 from types import NoneType, UnionType
-from typing import Annotated, Any, get_args, get_origin
+from typing import TYPE_CHECKING, Annotated, Any, get_args, get_origin
 from uuid import UUID
 
-import docstring_parser
-import openapi_pydantic as openapi
-from openapi_pydantic import Parameter, PathItem
-from openapi_pydantic.util import PydanticSchema
 from pydantic import BaseModel
 from rest_framework import exceptions
 
 from .errors import HttpError
 
+if TYPE_CHECKING:
+    import openapi_pydantic as openapi
+
 method_mapping = {
     "get": "retrieve",
     "post": "create",
@@ -24,21 +24,27 @@ method_mapping = {
     "delete": "destroy",
 }
 
-_builtin_openapi_map = {
-    builtins.bool: openapi.Schema(type=openapi.DataType.BOOLEAN),
-    builtins.str: openapi.Schema(type=openapi.DataType.STRING),
-    builtins.int: openapi.Schema(type=openapi.DataType.INTEGER),
-    builtins.float: openapi.Schema(type=openapi.DataType.NUMBER),
-    datetime: openapi.Schema(type=openapi.DataType.STRING, format="date-time"),
-    date: openapi.Schema(type=openapi.DataType.STRING, format="date"),
-    time: openapi.Schema(type=openapi.DataType.STRING, format="time"),
-    UUID: openapi.Schema(type=openapi.DataType.STRING, format="uuid"),
-}
+
+@cache
+def _builtin_openapi_map() -> dict:
+    # openapi_pydantic is only needed while generating the schema, import it lazily
+    import openapi_pydantic as openapi
+
+    return {
+        builtins.bool: openapi.Schema(type=openapi.DataType.BOOLEAN),
+        builtins.str: openapi.Schema(type=openapi.DataType.STRING),
+        builtins.int: openapi.Schema(type=openapi.DataType.INTEGER),
+        builtins.float: openapi.Schema(type=openapi.DataType.NUMBER),
+        datetime: openapi.Schema(type=openapi.DataType.STRING, format="date-time"),
+        date: openapi.Schema(type=openapi.DataType.STRING, format="date"),
+        time: openapi.Schema(type=openapi.DataType.STRING, format="time"),
+        UUID: openapi.Schema(type=openapi.DataType.STRING, format="uuid"),
+    }
 
 
-def get_builtin_type(ty: type) -> openapi.Schema | None:
+def get_builtin_type(ty: type) -> "openapi.Schema | None":
     ty = get_actual_type(ty)
-    if schema := _builtin_openapi_map.get(ty):
+    if schema := _builtin_openapi_map().get(ty):
         return schema.model_copy()
     return None
 
@@ -83,6 +89,9 @@ class DocsMetadata:
         self.response = response
 
     def generate_parameters(self, parameter_location: ParameterLocation):
+        from openapi_pydantic import Parameter
+        from openapi_pydantic.util import PydanticSchema
+
         params = []
         data = None
         if parameter_location == ParameterLocation.QUERY:
@@ -139,6 +148,8 @@ def docs(
 
 class Docstring:
     def __init__(self, docstring: str):
+        import docstring_parser
+
         docstring = docstring_parser.parse(docstring)
         self.short_description = docstring.short_description
         self.long_description = docstring.long_description
@@ -161,14 +172,19 @@ def extract_ref_source(ref: str):
         return model_name
 
 
-def get_view_version(view) -> str:
+def get_view_version(view, request=None) -> str:
+    request = request if request is not None else view.request
     try:
-        version, _ = view.determine_version(view.request, **view.kwargs)
+        version, _ = view.determine_version(request, **view.kwargs)
         return str(version)
     except exceptions.NotAcceptable:
         return ""
 
 
-class PathItemEx(PathItem):
-    def is_empty(self):
-        return not (self.get or self.post or self.delete or self.head or self.put or self.patch)
+def __getattr__(name: str):
+    # `PathItemEx` moved to the generator to keep openapi_pydantic off the import path
+    if name == "PathItemEx":
+        from .generator import PathItemEx
+
+        return PathItemEx
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
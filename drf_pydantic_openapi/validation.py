@@ -0,0 +1,178 @@
+import inspect
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
+from inspect import isclass
+from types import UnionType
+from typing import Union, get_args, get_origin
+
+from loguru import logger
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from .settings import config
+from .signals import response_contract_mismatch, response_validation_over_budget
+
+
+@dataclass
+class _HandlerStats:
+    # Moving average of the validation cost, used to skip payloads that wouldn't fit the budget
+    seconds_per_item: float | None = None
+    # Consecutive validations over the budget
+    overruns: int = 0
+    # `time.monotonic()` until which the handler isn't validated
+    paused_until: float = 0.0
+
+
+_handler_stats: dict = defaultdict(_HandlerStats)
+
+
+def count_items(data, limit: int) -> int:
+    """
+    Count the json values in `data`, stops as soon as the count exceeds `limit`
+    """
+    if isinstance(data, (str, bytes)):
+        # Serialized json, every value but the first one follows a comma
+        return data.count(b"," if isinstance(data, bytes) else ",") + 1
+
+    count = 1
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list, tuple)):
+            count += len(value)
+            if count > limit:
+                break
+            stack.extend(value.values() if isinstance(value, dict) else value)
+    return count
+
+
+@cache
+def get_response_validators(view_func) -> dict[int, TypeAdapter]:
+    """
+    Compile a validator for each documented status code of the handler.
+    Documented models are resolved the same way as `Document.generate_responses` does.
+    """
+    models = defaultdict(list)
+    return_type = inspect.signature(view_func).return_annotation
+    docs = getattr(view_func, "docs_metadata", None)
+    if docs:
+        if response_model := docs.response:
+            return_type = response_model
+
+        for error in docs.errors:
+            models[int(error.status_code)].append(error.ResponseModel)
+
+    if return_type is not inspect.Signature.empty:
+        return_types = get_args(return_type) if get_origin(return_type) is UnionType else (return_type,)
+        for single_return_type in return_types:
+            if isclass(single_return_type) and issubclass(single_return_type, BaseModel):
+                status_code = int(single_return_type.model_config.get("status_code", 200))
+                models[status_code].append(single_return_type)
+
+    return {status_code: TypeAdapter(Union[tuple(types)]) for status_code, types in models.items()}
+
+
+class ResponseValidationMixin:
+    """
+    APIView mixin validating a sample of the responses against the documented response models.
+    Mismatches are logged and sent with the `response_contract_mismatch` signal, the response itself
+    is never changed.
+
+    A validation can't be interrupted, so the time budget is enforced up front: payloads with more values
+    than `RESPONSE_VALIDATION_MAX_ITEMS`, or than the handler's measured cost per value fits in the budget,
+    are skipped. A handler going over the budget `RESPONSE_VALIDATION_MAX_OVERRUNS` times in a row is
+    paused for `RESPONSE_VALIDATION_COOLDOWN` seconds.
+    """
+
+    # Override the `RESPONSE_VALIDATION_*` settings per view
+    response_validation_sample_rate: float | None = None
+    response_validation_time_budget: float | None = None
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        sample_rate = self.response_validation_sample_rate
+        if sample_rate is None:
+            sample_rate = config.response_validation_sample_rate
+
+        if sample_rate > 0 and random.random() < sample_rate:
+            try:
+                self.validate_response(request, response)
+            except Exception as e:
+                logger.warning(f"Error while validating the response of {self.__class__.__name__}: {str(e)}")
+        return response
+
+    def validate_response(self, request, response):
+        handler = getattr(self, request.method.lower(), None)
+        view_func = getattr(handler, "__func__", handler)
+        if view_func is None:
+            return
+
+        data = getattr(response, "data", None)
+        validator = get_response_validators(view_func).get(response.status_code)
+        if data is None or validator is None:
+            return
+
+        stats = _handler_stats[view_func]
+        now = time.monotonic()
+        if stats.paused_until > now:
+            return
+
+        time_budget = self.response_validation_time_budget
+        if time_budget is None:
+            time_budget = config.response_validation_time_budget
+
+        item_limit = config.response_validation_max_items
+        if stats.seconds_per_item:
+            item_limit = min(item_limit, int(time_budget / stats.seconds_per_item))
+        items = count_items(data, item_limit)
+        if items > item_limit:
+            if stats.seconds_per_item:
+                # Relax the estimate, so a single slow sample doesn't skip the handler's payloads for good
+                stats.seconds_per_item *= 0.9
+            return
+
+        start = time.perf_counter()
+        try:
+            # `typed_exception_handler` responds with the already serialized error
+            if isinstance(data, (str, bytes)):
+                validator.validate_json(data)
+            else:
+                validator.validate_python(data)
+        except ValidationError as e:
+            errors = e.errors(include_input=False, include_url=False)
+            logger.warning(
+                f"Response of {self.__class__.__name__}.{view_func.__name__} doesn't match the documented "
+                f"model for status {response.status_code}: {errors}",
+            )
+            response_contract_mismatch.send(
+                sender=self.__class__,
+                request=request,
+                response=response,
+                status_code=response.status_code,
+                errors=errors,
+            )
+
+        duration = time.perf_counter() - start
+        cost = duration / items
+        stats.seconds_per_item = cost if stats.seconds_per_item is None else 0.8 * stats.seconds_per_item + 0.2 * cost
+        if duration <= time_budget:
+            stats.overruns = 0
+            return
+
+        stats.overruns += 1
+        if stats.overruns >= config.response_validation_max_overruns:
+            stats.overruns = 0
+            stats.paused_until = now + config.response_validation_cooldown
+            logger.warning(
+                f"Validating the response of {self.__class__.__name__}.{view_func.__name__} took {duration:.4f}s, "
+                f"pausing response validation for it for {config.response_validation_cooldown}s",
+            )
+            response_validation_over_budget.send(
+                sender=self.__class__,
+                request=request,
+                response=response,
+                handler=view_func,
+                duration=duration,
+            )
@@ -1,12 +1,14 @@
 import json
+from functools import partial
 from typing import Any
 
+from django.http import HttpResponse, StreamingHttpResponse
 from django.views.generic import TemplateView
 from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
-from .generator import Document
+from .schema_cache import document_cache
 from .settings import config
 
 
@@ -15,6 +17,7 @@ def get_schema_view(
     tag_path_regex=None,
     permission_classes=None,
     authentication_classes=None,
+    stream=False,
 ):
     _api_version = api_version
     _tag_path_regex = tag_path_regex
@@ -30,13 +33,34 @@ def get_schema_view(
             if hasattr(request, "version"):
                 version = request.version
 
-            config.initialize_sources()
-            document = Document(
-                api_version=version,
-                tag_path_regex=_tag_path_regex,
-            )
-            schema = document.get_schema(request=request)
-            return Response(json.loads(schema), headers={"Cache-Control": "no-cache, no-store, must-revalidate"})
+            # Imported here so the openapi dependencies only load when a schema is served
+            from .generator import Document, build_schema
+
+            headers = {"Cache-Control": "no-cache, no-store, must-revalidate"}
+            if config.warm_up:
+                from .warm_up import wait_for_warm_up
+
+                # Serve the document built by the warm-up instead of building it again.
+                # It is already in memory, so `stream` has nothing to save and is ignored.
+                wait_for_warm_up()
+                build = partial(build_schema, api_version=version, tag_path_regex=_tag_path_regex, request=request)
+                schema = document_cache.get_or_build((version, _tag_path_regex), build)
+                return HttpResponse(schema, content_type="application/json", headers=headers)
+
+            if stream:
+                config.initialize_sources()
+                document = Document(
+                    api_version=version,
+                    tag_path_regex=_tag_path_regex,
+                )
+                # Serialize the document while sending it instead of building it in memory
+                return StreamingHttpResponse(
+                    document.iter_schema(request=request),
+                    content_type="application/json",
+                    headers=headers,
+                )
+            schema = build_schema(api_version=version, tag_path_regex=_tag_path_regex, request=request)
+            return Response(json.loads(schema), headers=headers)
 
     return DrfPydanticSchemaView
 
@@ -0,0 +1,106 @@
+import threading
+import time
+from functools import partial
+
+from django.http import HttpRequest, QueryDict
+from django.urls import get_resolver
+from loguru import logger
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.versioning import (
+    AcceptHeaderVersioning,
+    NamespaceVersioning,
+    QueryParameterVersioning,
+    URLPathVersioning,
+)
+
+from .schema_cache import document_cache
+from .settings import config
+from .signals import schema_warm_up_finished
+
+_finished = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def get_versions() -> list[str | None]:
+    if api_settings.DEFAULT_VERSIONING_CLASS is None:
+        # Without versioning `request.version` is always None
+        return [None]
+    return list(api_settings.ALLOWED_VERSIONS or [api_settings.DEFAULT_VERSION])
+
+
+def _make_request(version: str | None) -> Request | None:
+    """
+    Schema generation clones the request for every view, so the warm-up needs one outside of a request cycle.
+    The request carries the version the way the versioning scheme reads it, None is returned for schemes
+    it can't be built for (e.g. `HostNameVersioning`).
+    """
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    http_request.META.update(SERVER_NAME="localhost", SERVER_PORT="80")
+
+    versioning_class = api_settings.DEFAULT_VERSIONING_CLASS
+    if versioning_class is None or issubclass(versioning_class, (URLPathVersioning, NamespaceVersioning)):
+        # The version is read from the url of each view, not from this request
+        return Request(http_request)
+
+    scheme = versioning_class()
+    if issubclass(versioning_class, QueryParameterVersioning):
+        http_request.GET = QueryDict(mutable=True)
+        http_request.GET[scheme.version_param] = version
+    request = Request(http_request)
+    if issubclass(versioning_class, AcceptHeaderVersioning):
+        # Normally set by the content negotiation
+        request.accepted_media_type = f"application/json; {scheme.version_param}={version}"
+
+    # Never build from a request that doesn't resolve to the requested version
+    try:
+        if scheme.determine_version(request) == version:
+            return request
+    except exceptions.APIException:
+        pass
+    return None
+
+
+def warm_up(sender=None):
+    """Build the schema of every version into `document_cache`"""
+    from .generator import build_schema
+
+    start = time.perf_counter()
+    versions = get_versions()
+    try:
+        # Make sure the url conf is loaded before walking it
+        get_resolver().url_patterns
+        for version in versions:
+            if (request := _make_request(version)) is None:
+                logger.warning(f"Can't build a request for version {version}, skipping its schema warm-up")
+                continue
+            try:
+                build = partial(build_schema, api_version=version, tag_path_regex=None, request=request)
+                document_cache.get_or_build((version, None), build)
+            except Exception as e:
+                logger.warning(f"Error while warming up the schema of version {version}: {str(e)}")
+    finally:
+        duration = time.perf_counter() - start
+        _finished.set()
+        logger.info(f"Schema warm-up finished in {duration:.2f}s for versions: {versions}")
+        schema_warm_up_finished.send(sender=sender, versions=versions, duration=duration)
+
+
+def start_warm_up(sender=None) -> None:
+    """
+    Start the warm-up thread, does nothing unless `WARM_UP` is enabled.
+    Call it from wsgi.py/asgi.py after the application is created.
+    """
+    global _thread
+    if _thread is not None or not config.warm_up:
+        return
+    _thread = threading.Thread(target=warm_up, kwargs={"sender": sender}, name="dpo-schema-warm-up", daemon=True)
+    _thread.start()
+
+
+def wait_for_warm_up() -> None:
+    """Block until the warm-up is finished, returns immediately if it was never started"""
+    if _thread is not None:
+        _finished.wait()